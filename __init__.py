@@ -4,25 +4,87 @@
 # systems are original implementations by kxn4t.
 
 import bpy
+import numpy as np
+from dataclasses import dataclass
 from bpy.props import PointerProperty
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 from .translations import translations_dict
 
-ShapeKeyDataDict = Dict[str, Any]  # Shape key properties dictionary
-ShapeKeyDataList = List[ShapeKeyDataDict]  # List of shape key data
-ModifierDataDict = Dict[str, Any]  # Modifier settings dictionary
-ObjectNameToDriverState = Dict[str, bool]  # Object name -> driver exists flag
-ObjectNameToModifierData = Dict[
-    str, Optional[ModifierDataDict]
-]  # Object name -> modifier data
+
+class ArmatureModData(NamedTuple):
+    """Armature modifier settings snapshot"""
+
+    name: str
+    object: Optional[bpy.types.Object]
+    use_deform_preserve_volume: bool
+    use_vertex_groups: bool
+    use_bone_envelopes: bool
+    vertex_group: str
+    invert_vertex_group: bool
+    show_viewport: bool
+    show_render: bool
+    show_in_editmode: bool
+    show_on_cage: bool
+    index: int
+
+
+class ShapeKeyColumns(NamedTuple):
+    """Shape key properties stored column-wise, one list entry per key block"""
+
+    name: List[str]
+    value: List[float]
+    slider_min: List[float]
+    slider_max: List[float]
+    mute: List[bool]
+    interpolation: List[str]
+    relative_key: List[Optional[int]]  # Index of the relative key block
+    vertex_group: List[str]
+    custom_properties: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class MeshRecord:
+    """Per-mesh state carried from collection through restoration"""
+
+    obj: bpy.types.Object
+    driver_state: bool
+    armature_mod: Optional[ArmatureModData]
+    receiver: Optional[bpy.types.Object] = None  # Copy holding the posed shape keys
+    deformed_coords: Optional[np.ndarray] = None  # Posed vertices, no shape keys
+    shape_key_props: Optional[ShapeKeyColumns] = None
+    original_shape_keys: Optional[bpy.types.Key] = None
+
+
 MeshObjectList = List[bpy.types.Object]  # List of mesh objects
 OriginalStateDict = Dict[str, Any]  # Original context state dictionary
 OperatorResultDict = Dict[str, str]  # Blender operator result dictionary
 ValidationResult = Tuple[
     bpy.types.Object, MeshObjectList
 ]  # Armature and affected meshes
-PendingMeshChange = Dict[str, Any]  # Pending shape key data swap
+
+
+# Modifiers that deform the mesh and must not precede the Armature modifier
+_DEFORM_MODS = frozenset(
+    {
+        "MESH_DEFORM",
+        "LATTICE",
+        "CLOTH",
+        "SOFT_BODY",
+        "MESH_CACHE",
+        "SURFACE_DEFORM",
+        "VOLUME_DEFORM",
+        "NODES",
+        "DISPLACE",
+        "WAVE",
+        "SHRINKWRAP",
+        "SIMPLE_DEFORM",
+    }
+)
+
+# Vertex data is moved between Blender and Python through foreach_get/foreach_set
+# with buffers of Blender's native float type, never per-vertex Python loops.
+_F32 = np.single
 
 
 # =============================================================================
@@ -30,9 +92,21 @@ PendingMeshChange = Dict[str, Any]  # Pending shape key data swap
 # =============================================================================
 
 
-def log(msg: str) -> None:
-    """Print console message"""
-    print(f"<PoseToRest> {msg}")
+_DEBUG = False  # Enable to trace each processing step in the console
+
+
+def log(msg: str, *args: Any) -> None:
+    """Print console message when debug output is enabled.
+
+    Arguments are %-formatted only when the message is actually printed.
+    """
+    if _DEBUG:
+        print(f"<PoseToRest> {msg % args if args else msg}")
+
+
+def log_error(msg: str, *args: Any) -> None:
+    """Print warning or error console message regardless of _DEBUG"""
+    print(f"<PoseToRest> {msg % args if args else msg}")
 
 
 class ViewLayerScope:
@@ -140,48 +214,85 @@ class ViewLayerScope:
         return result or bpy.context.scene.collection
 
 
+_ARMATURE_MOD_CACHE: Dict[str, Tuple[int, str]] = {}  # Object name -> (index, name)
+
+
+def _find_armature_mod(
+    obj: bpy.types.Object, armature: bpy.types.Object
+) -> Optional[Tuple[int, bpy.types.Modifier]]:
+    """Find the armature modifier targeting armature, reusing its cached position"""
+    modifiers = obj.modifiers
+    cached = _ARMATURE_MOD_CACHE.get(obj.name)
+    if cached is not None:
+        index, name = cached
+        if index < len(modifiers):
+            mod = modifiers[index]
+            if mod.name == name and mod.type == "ARMATURE" and mod.object == armature:
+                return index, mod
+
+    for index, mod in enumerate(modifiers):
+        if mod.type == "ARMATURE" and mod.object == armature:
+            _ARMATURE_MOD_CACHE[obj.name] = (index, mod.name)
+            return index, mod
+    return None
+
+
+def _inherit_armature_mod_cache(
+    obj: bpy.types.Object, copy_obj: bpy.types.Object
+) -> None:
+    """Let a copy reuse the source's cached armature modifier position"""
+    cached = _ARMATURE_MOD_CACHE.get(obj.name)
+    if cached is not None:
+        _ARMATURE_MOD_CACHE[copy_obj.name] = cached
+
+
 def copy_object(obj: bpy.types.Object, name_suffix: str = "copy") -> bpy.types.Object:
-    """Create a copy of object with new mesh data"""
+    """Create a copy of object with new mesh data.
+
+    Uses obj.copy() rather than objects.new() so modifiers and vertex group
+    names come along with the copy. The copy is not linked to any collection,
+    so editing it does not propagate through the scene graph; wrap code that
+    needs it evaluated in ViewLayerScope.
+    """
     copy_obj = obj.copy()
     copy_obj.data = obj.data.copy()
     copy_obj.name = f"{obj.name}_{name_suffix}"
     copy_obj.data.name = f"{obj.data.name}_{name_suffix}"
-    bpy.context.collection.objects.link(copy_obj)
+    _inherit_armature_mod_cache(obj, copy_obj)
     return copy_obj
 
 
 def delete_object(obj: Optional[bpy.types.Object]) -> None:
     """Safely delete object and its mesh data"""
+    delete_objects([obj])
+
+
+def delete_objects(objs: List[Optional[bpy.types.Object]]) -> None:
+    """Safely delete objects and their mesh data in a single batch.
+
+    Mesh data still used by objects outside the batch is kept.
+    """
+    # Guard each entry so one stale reference cannot leak the rest of the batch
+    live: List[bpy.types.Object] = []
+    batch_users: Dict[bpy.types.Mesh, int] = {}
+    for obj in objs:
+        try:
+            if not obj or bpy.data.objects.get(obj.name) != obj:
+                continue
+            if obj.data:
+                batch_users[obj.data] = batch_users.get(obj.data, 0) + 1
+            live.append(obj)
+        except Exception as e:
+            log_error("Error deleting object: %s", e)
+    if not live:
+        return
+
     try:
-        if obj and obj.name in bpy.data.objects:
-            if obj.data and obj.data.users == 1:
-                mesh_data = obj.data
-                bpy.data.objects.remove(obj)
-                if mesh_data.name in bpy.data.meshes:
-                    bpy.data.meshes.remove(mesh_data)
-            else:
-                bpy.data.objects.remove(obj)
+        # Meshes whose every user is in the batch become orphans and go with it
+        meshes = [mesh for mesh, count in batch_users.items() if mesh.users == count]
+        bpy.data.batch_remove(live + meshes)
     except Exception as e:
-        log(f"Error deleting object: {e}")
-
-
-def copy_attributes(source: Any, target: Any) -> None:
-    """Copy compatible attributes from source to target"""
-    keys = dir(source)
-    for key in keys:
-        if (
-            not key.startswith("_")
-            and not key.startswith("error_")
-            and key != "group"
-            and key != "strips"
-            and key != "is_valid"
-            and key != "rna_type"
-            and key != "bl_rna"
-        ):
-            try:
-                setattr(target, key, getattr(source, key))
-            except AttributeError:
-                pass
+        log_error("Error deleting objects: %s", e)
 
 
 # =============================================================================
@@ -189,6 +300,23 @@ def copy_attributes(source: Any, target: Any) -> None:
 # =============================================================================
 
 
+def _get_coords(elements: Any, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Read "co" of mesh vertices or shape key points into a flat float32 array.
+
+    Fills out when it has the right size, otherwise allocates a new array.
+    """
+    size = len(elements) * 3
+    if out is None or out.size != size:
+        out = np.empty(size, dtype=_F32)
+    elements.foreach_get("co", out)
+    return out
+
+
+def _set_coords(elements: Any, coords: np.ndarray) -> None:
+    """Write a flat float32 array to "co" of mesh vertices or shape key points"""
+    elements.foreach_set("co", coords)
+
+
 def apply_shape_key(obj: bpy.types.Object, sk_keep: int) -> None:
     """Keep only the specified shape key and bake it into the mesh"""
     if not obj.data.shape_keys:
@@ -198,36 +326,19 @@ def apply_shape_key(obj: bpy.types.Object, sk_keep: int) -> None:
     if not (0 <= sk_keep < len(shapekeys)):
         return
 
-    # Remove all other shape keys
-    for i in reversed(range(len(shapekeys))):
-        if i != sk_keep:
-            obj.shape_key_remove(shapekeys[i])
-
-    # Remove the remaining one to bake it into the mesh
-    if obj.data.shape_keys and len(obj.data.shape_keys.key_blocks) > 0:
-        obj.shape_key_remove(obj.data.shape_keys.key_blocks[0])
-
+    # Read the kept shape into a float32 buffer so foreach_get/set can memcpy
+    coords = _get_coords(shapekeys[sk_keep].data)
 
-def add_objs_shapekeys(destination: bpy.types.Object, sources: MeshObjectList) -> None:
-    """Add source objects as shape keys to destination"""
-    with ViewLayerScope(destination, *sources):
-        for o in bpy.context.view_layer.objects:
-            o.select_set(False)
-
-        for src in sources:
-            src.select_set(True)
-
-        bpy.context.view_layer.objects.active = destination
-        bpy.ops.object.join_shapes()
+    # Remove all shape keys in one call, then bake the kept shape into the mesh
+    obj.shape_key_clear()
+    _set_coords(obj.data.vertices, coords)
+    obj.data.update()
 
 
 def validate_vertex_count_compatibility(
-    base_obj: bpy.types.Object, shapekey_obj: bpy.types.Object, shapekey_name: str
+    base_vertex_count: int, shapekey_vertex_count: int, shapekey_name: str
 ) -> None:
-    """Validate that objects have compatible vertex counts for shape key transfer"""
-    base_vertex_count = len(base_obj.data.vertices)
-    shapekey_vertex_count = len(shapekey_obj.data.vertices)
-
+    """Validate that vertex counts are compatible for shape key transfer"""
     if base_vertex_count != shapekey_vertex_count:
         error_msg = bpy.app.translations.pgettext(
             "Cannot transfer shape key '{shapekey_name}': vertex count mismatch ({base_count} vs {shapekey_count}). Check for modifiers that change vertex count (Decimate, Weld, etc.)."
@@ -239,274 +350,347 @@ def validate_vertex_count_compatibility(
         raise ValueError(error_msg)
 
 
-def validate_shape_key_transfer(
-    receiver: bpy.types.Object, expected_shapekey_index: int, shapekey_name: str
-) -> None:
-    """Validate shape key transfer was successful"""
-    # Check if shape keys exist at all
-    if receiver.data.shape_keys is None:
-        error_msg = bpy.app.translations.pgettext(
-            "Cannot transfer shape key '{shapekey_name}': vertex count mismatch after modifiers"
-        ).format(shapekey_name=shapekey_name)
-        raise ValueError(error_msg)
-
-    # Check if the correct number of shape keys were transferred
-    current_shapekey_count = (
-        len(receiver.data.shape_keys.key_blocks) - 1
-    )  # Exclude basis
-    if current_shapekey_count != expected_shapekey_index:
-        error_msg = bpy.app.translations.pgettext(
-            "Shape key transfer failed for '{shapekey_name}': expected {expected_keys} keys, got {actual_keys}"
-        ).format(
-            shapekey_name=shapekey_name,
-            expected_keys=expected_shapekey_index,
-            actual_keys=current_shapekey_count,
-        )
-        raise ValueError(error_msg)
-
-
 # =============================================================================
 # MODIFIER OPERATIONS
 # =============================================================================
 
 
+def _read_armature_deform(
+    obj: bpy.types.Object,
+    modifier: bpy.types.ArmatureModifier,
+    armature: bpy.types.Object,
+) -> np.ndarray:
+    """Evaluate obj with only modifier enabled and return the vertex positions"""
+    # Evaluate with every other modifier disabled so only the armature deforms.
+    # The armature itself may be hidden in the viewport on heavy rigs.
+    armature_shown = modifier.show_viewport
+    modifier.show_viewport = True
+    disabled = [mod for mod in obj.modifiers if mod.show_viewport and mod != modifier]
+    for mod in disabled:
+        mod.show_viewport = False
+    try:
+        with ViewLayerScope(obj, armature):
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            eval_obj = obj.evaluated_get(depsgraph)
+            try:
+                return _get_coords(eval_obj.to_mesh().vertices)
+            finally:
+                eval_obj.to_mesh_clear()
+    except RuntimeError as e:
+        log_error("Failed to evaluate armature modifier on %s: %s", obj.name, e)
+        raise
+    finally:
+        for mod in disabled:
+            mod.show_viewport = True
+        modifier.show_viewport = armature_shown
+
+
+def read_armature_deformed_coords(
+    obj: bpy.types.Object, armature: bpy.types.Object
+) -> Optional[np.ndarray]:
+    """Return vertex positions of obj deformed only by its armature modifier.
+
+    Returns None if obj has no armature modifier targeting armature.
+    """
+    found = _find_armature_mod(obj, armature)
+    if found is None:
+        return None
+    return _read_armature_deform(obj, found[1], armature)
+
+
 def apply_armature_modifier_only(
     obj: bpy.types.Object, armature: bpy.types.Object
 ) -> None:
     """Apply only armature modifiers targeting the specified armature"""
-    for modifier in obj.modifiers:
-        if modifier.type == "ARMATURE" and modifier.object == armature:
-            with ViewLayerScope(obj, armature):
-                # Set up selection
-                for o in bpy.context.view_layer.objects:
-                    o.select_set(False)
-                obj.select_set(True)
-                bpy.context.view_layer.objects.active = obj
+    found = _find_armature_mod(obj, armature)
+    if found is None:
+        return
+    modifier = found[1]
 
-                try:
-                    # Store modifier name before applying (important for stability)
-                    mod_name = modifier.name
-                    bpy.ops.object.modifier_apply(modifier=mod_name)
-                    log(f"Applied armature modifier {mod_name} on object {obj.name}")
-                except RuntimeError as e:
-                    log(f"Failed to apply armature modifier on {obj.name}: {e}")
-                    raise
-            break
+    mod_name = modifier.name
+    coords = _read_armature_deform(obj, modifier, armature)
+
+    # The armature only moves vertices, so write them back into the same Mesh
+    # and keep its custom properties, animation data and settings
+    _set_coords(obj.data.vertices, coords)
+    obj.data.update()
+    obj.modifiers.remove(modifier)
+    log("Applied armature modifier %s on object %s", mod_name, obj.name)
+
+
+def create_deform_evaluator(
+    obj: bpy.types.Object, armature: bpy.types.Object
+) -> bpy.types.Object:
+    """Create a shape-key-free copy of obj deformed only by the armature.
+
+    Used with read_deformed_coords to pose arbitrary vertex positions.
+    """
+    evaluator = copy_object(obj, "shapekey_evaluator")
+    try:
+        apply_shape_key(evaluator, 0)
+        found = _find_armature_mod(evaluator, armature)
+        armature_mod = found[1] if found else None
+        for mod in evaluator.modifiers:
+            # Only the armature deforms, even if hidden in the viewport on obj
+            mod.show_viewport = mod == armature_mod
+    except Exception:
+        delete_object(evaluator)
+        raise
+    return evaluator
+
+
+def read_deformed_coords(
+    evaluator: bpy.types.Object,
+    coords: np.ndarray,
+    depsgraph: bpy.types.Depsgraph,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Load coords into the evaluator mesh and return them after deformation.
+
+    The evaluator must be in the view layer that owns depsgraph.
+    The result is written to out when its size matches.
+    """
+    mesh = evaluator.data
+    _set_coords(mesh.vertices, coords)
+    mesh.update()
+
+    depsgraph.update()
+    eval_obj = evaluator.evaluated_get(depsgraph)
+    try:
+        return _get_coords(eval_obj.to_mesh().vertices, out)
+    finally:
+        eval_obj.to_mesh_clear()
 
 
 # =============================================================================
-# DATA PRESERVATION CLASSES
+# DRIVER OPERATIONS
 # =============================================================================
 
+def _copy_driver(
+    shape_keys: bpy.types.Key,
+    src_fcurve: bpy.types.FCurve,
+    original_shape_keys: bpy.types.Key,
+) -> None:
+    """Copy a driver F-Curve to shape_keys, remapping references to the old Key"""
+    drivers = shape_keys.animation_data.drivers
+    fcurve = drivers.from_existing(src_driver=src_fcurve)
+    try:
+        for variable in fcurve.driver.variables:
+            for target in variable.targets:
+                if target.id_type == "KEY" and target.id == original_shape_keys:
+                    target.id = shape_keys
+    except Exception:
+        drivers.remove(fcurve)
+        raise
 
-class ShapeKeyManager:
-    """Manages shape key properties and custom data"""
 
-    @staticmethod
-    def store_properties(obj: bpy.types.Object) -> Optional[ShapeKeyDataList]:
-        """Store all shape key properties including custom properties"""
-        if not obj.data.shape_keys:
-            return None
+# =============================================================================
+# DATA PRESERVATION
+# =============================================================================
+
+
+def _store_shapekey_properties(obj: bpy.types.Object) -> Optional[ShapeKeyColumns]:
+    """Store all shape key properties including custom properties"""
+    if not obj.data.shape_keys:
+        return None
 
-        shape_key_data = []
-        for sk in obj.data.shape_keys.key_blocks:
-            # Safely get custom properties
+    columns = ShapeKeyColumns([], [], [], [], [], [], [], [], [])
+    relative_names: List[Optional[str]] = []
+    for sk in obj.data.shape_keys.key_blocks:
+        # Safely get custom properties
+        custom_props = {}
+        try:
+            if hasattr(sk, "items"):
+                custom_props = {
+                    key: value
+                    for key, value in sk.items()
+                    if not key.startswith("_")
+                }
+        except (TypeError, AttributeError):
             custom_props = {}
-            try:
-                if hasattr(sk, "keys"):
-                    custom_props = {
-                        key: sk[key] for key in sk.keys() if not key.startswith("_")
-                    }
-            except (TypeError, AttributeError):
-                custom_props = {}
-
-            sk_data = {
-                "name": sk.name,
-                "value": sk.value,
-                "slider_min": sk.slider_min,
-                "slider_max": sk.slider_max,
-                "mute": sk.mute,
-                "interpolation": sk.interpolation,
-                "relative_key": sk.relative_key.name if sk.relative_key else None,
-                "vertex_group": sk.vertex_group,
-                "custom_properties": custom_props,
-            }
-            shape_key_data.append(sk_data)
-        return shape_key_data
 
-    @staticmethod
-    def restore_properties(
-        obj: bpy.types.Object, shape_key_data: Optional[ShapeKeyDataList]
-    ) -> None:
-        """Restore shape key properties including custom properties"""
-        if not shape_key_data or not obj.data.shape_keys:
-            return
-
-        for i, sk_data in enumerate(shape_key_data):
-            if i < len(obj.data.shape_keys.key_blocks):
-                sk = obj.data.shape_keys.key_blocks[i]
-                sk.name = sk_data["name"]
-                sk.value = sk_data["value"]
-                sk.slider_min = sk_data["slider_min"]
-                sk.slider_max = sk_data["slider_max"]
-                sk.mute = sk_data["mute"]
-                sk.interpolation = sk_data["interpolation"]
-                sk.vertex_group = sk_data["vertex_group"]
-
-                # Restore relative key reference
-                if sk_data["relative_key"]:
-                    for ref_sk in obj.data.shape_keys.key_blocks:
-                        if ref_sk.name == sk_data["relative_key"]:
-                            sk.relative_key = ref_sk
-                            break
-
-                # Restore custom properties
-                try:
-                    for key, value in sk_data["custom_properties"].items():
-                        sk[key] = value
-                except (TypeError, AttributeError):
-                    log(f"Could not restore custom properties for shape key {sk.name}")
+        relative_key = sk.relative_key
+        columns.name.append(sk.name)
+        columns.value.append(sk.value)
+        columns.slider_min.append(sk.slider_min)
+        columns.slider_max.append(sk.slider_max)
+        columns.mute.append(sk.mute)
+        columns.interpolation.append(sk.interpolation)
+        relative_names.append(relative_key.name if relative_key else None)
+        columns.vertex_group.append(sk.vertex_group)
+        columns.custom_properties.append(custom_props)
+
+    # Resolve relative keys to indices now so restore never searches by name
+    name_to_index = {name: i for i, name in enumerate(columns.name)}
+    columns.relative_key.extend(name_to_index.get(name) for name in relative_names)
+    return columns
+
+
+def _restore_shapekey_properties(
+    obj: bpy.types.Object, shape_key_data: Optional[ShapeKeyColumns]
+) -> None:
+    """Restore shape key properties including custom properties"""
+    if not shape_key_data or not obj.data.shape_keys:
+        return
 
+    key_blocks = list(obj.data.shape_keys.key_blocks)
+
+    for sk, name in zip(key_blocks, shape_key_data.name):
+        sk.name = name
+    for sk, value in zip(key_blocks, shape_key_data.value):
+        sk.value = value
+    for sk, slider_min in zip(key_blocks, shape_key_data.slider_min):
+        sk.slider_min = slider_min
+    for sk, slider_max in zip(key_blocks, shape_key_data.slider_max):
+        sk.slider_max = slider_max
+    for sk, mute in zip(key_blocks, shape_key_data.mute):
+        sk.mute = mute
+    for sk, interpolation in zip(key_blocks, shape_key_data.interpolation):
+        sk.interpolation = interpolation
+    for sk, vertex_group in zip(key_blocks, shape_key_data.vertex_group):
+        sk.vertex_group = vertex_group
+
+    # Restore relative key references by their stored indices
+    for sk, relative_index in zip(key_blocks, shape_key_data.relative_key):
+        if relative_index is not None and relative_index < len(key_blocks):
+            sk.relative_key = key_blocks[relative_index]
+
+    # Restore custom properties
+    for sk, custom_props in zip(key_blocks, shape_key_data.custom_properties):
+        try:
+            for key, value in custom_props.items():
+                sk[key] = value
+        except (TypeError, AttributeError):
+            log_error("Could not restore custom properties for shape key %s", sk.name)
+
+
+def _check_drivers_exist(obj: bpy.types.Object) -> bool:
+    """Check if drivers exist on shape keys before processing"""
+    if (
+        not obj.data.shape_keys
+        or not obj.data.shape_keys.animation_data
+        or not obj.data.shape_keys.animation_data.drivers
+    ):
+        return False
+    return True
 
-class DriverManager:
-    """Manages shape key drivers preservation and restoration"""
 
-    @staticmethod
-    def check_drivers_exist(obj: bpy.types.Object) -> bool:
-        """Check if drivers exist on shape keys before processing"""
-        if (
-            not obj.data.shape_keys
-            or not obj.data.shape_keys.animation_data
-            or not obj.data.shape_keys.animation_data.drivers
-        ):
-            return False
-        return True
+def _restore_drivers(
+    obj: bpy.types.Object,
+    drivers_existed: bool,
+    original_shape_keys: Optional[bpy.types.Key],
+) -> None:
+    """Restore drivers from original shape keys to processed object.
 
-    @staticmethod
-    def restore_drivers(
-        obj: bpy.types.Object,
-        drivers_existed: bool,
-        original_shape_keys: Optional[bpy.types.Key],
-    ) -> None:
-        """Restore drivers from original shape keys to processed object.
+    Raises on failure so the caller can handle it in the post-destructive zone.
+    """
+    if not drivers_existed or not original_shape_keys:
+        return
+    if not original_shape_keys.animation_data:
+        return
 
-        Raises on failure so the caller can handle it in the post-destructive zone.
-        """
-        if not drivers_existed or not original_shape_keys:
-            return
-        if not original_shape_keys.animation_data:
-            return
-
-        new_shape_keys = obj.data.shape_keys
-        if not new_shape_keys:
-            raise RuntimeError(
-                f"Cannot restore drivers for {obj.name}: new shape keys missing"
-            )
+    new_shape_keys = obj.data.shape_keys
+    if not new_shape_keys:
+        raise RuntimeError(
+            f"Cannot restore drivers for {obj.name}: new shape keys missing"
+        )
 
-        # Clear existing drivers
-        if new_shape_keys.animation_data:
-            new_shape_keys.animation_data_clear()
+    # Clear existing drivers only if there are any to replace
+    anim_data = new_shape_keys.animation_data
+    if anim_data and anim_data.drivers:
+        new_shape_keys.animation_data_clear()
+        anim_data = None
 
-        # Create animation data
+    # Create animation data
+    if not anim_data:
         new_shape_keys.animation_data_create()
 
-        # Transfer drivers one by one so a single failure doesn't
-        # leave already-copied drivers without the remap pass.
-        failed_paths: List[str] = []
-        for orig_driver in original_shape_keys.animation_data.drivers:
-            try:
-                new_shape_keys.animation_data.drivers.from_existing(
-                    src_driver=orig_driver
-                )
-            except Exception as e:
-                failed_paths.append(orig_driver.data_path)
-                log(f"Could not copy driver {orig_driver.data_path} for {obj.name}: {e}")
-
-        # Remap old Key datablock references to new Key
-        for fcurve in new_shape_keys.animation_data.drivers:
-            for variable in fcurve.driver.variables:
-                for target in variable.targets:
-                    if (
-                        target.id_type == "KEY"
-                        and target.id == original_shape_keys
-                    ):
-                        target.id = new_shape_keys
-
-        if failed_paths:
-            raise RuntimeError(
-                f"Failed to copy {len(failed_paths)} driver(s) for {obj.name}: "
-                + ", ".join(failed_paths)
+    # Copy and remap drivers one by one so a single failure doesn't
+    # prevent the remaining drivers from being restored.
+    failed_paths: List[str] = []
+    for orig_driver in original_shape_keys.animation_data.drivers:
+        try:
+            _copy_driver(new_shape_keys, orig_driver, original_shape_keys)
+        except Exception as e:
+            failed_paths.append(orig_driver.data_path)
+            log_error(
+                "Could not copy driver %s for %s: %s",
+                orig_driver.data_path,
+                obj.name,
+                e,
             )
 
-        log(f"Successfully restored drivers for {obj.name}")
+    if failed_paths:
+        raise RuntimeError(
+            f"Failed to copy {len(failed_paths)} driver(s) for {obj.name}: "
+            + ", ".join(failed_paths)
+        )
 
+    log("Successfully restored drivers for %s", obj.name)
 
-class ModifierManager:
-    """Manages armature modifier settings"""
 
-    @staticmethod
-    def store_armature_modifier(
-        obj: bpy.types.Object, armature: bpy.types.Object
-    ) -> Optional[ModifierDataDict]:
-        """Store armature modifier settings"""
-        for i, mod in enumerate(obj.modifiers):
-            if mod.type == "ARMATURE" and mod.object == armature:
-                return {
-                    "name": mod.name,
-                    "object": mod.object,
-                    "use_deform_preserve_volume": mod.use_deform_preserve_volume,
-                    "use_vertex_groups": mod.use_vertex_groups,
-                    "use_bone_envelopes": mod.use_bone_envelopes,
-                    "vertex_group": mod.vertex_group,
-                    "invert_vertex_group": mod.invert_vertex_group,
-                    "show_viewport": mod.show_viewport,
-                    "show_render": mod.show_render,
-                    "show_in_editmode": mod.show_in_editmode,
-                    "show_on_cage": getattr(mod, "show_on_cage", False),
-                    "index": i,
-                }
+def _store_armature_modifier(
+    obj: bpy.types.Object, armature: bpy.types.Object
+) -> Optional[ArmatureModData]:
+    """Store armature modifier settings"""
+    found = _find_armature_mod(obj, armature)
+    if found is None:
         return None
 
-    @staticmethod
-    def create_armature_modifier(
-        obj: bpy.types.Object, mod_data: Optional[ModifierDataDict]
-    ) -> None:
-        """Create armature modifier with stored settings"""
-        if not mod_data:
-            return
-
-        mod = obj.modifiers.new(mod_data["name"], "ARMATURE")
-        mod.object = mod_data["object"]
-        mod.use_deform_preserve_volume = mod_data["use_deform_preserve_volume"]
-        mod.use_vertex_groups = mod_data["use_vertex_groups"]
-        mod.use_bone_envelopes = mod_data["use_bone_envelopes"]
-        mod.vertex_group = mod_data["vertex_group"]
-        mod.invert_vertex_group = mod_data["invert_vertex_group"]
-        mod.show_viewport = mod_data["show_viewport"]
-        mod.show_render = mod_data["show_render"]
-        mod.show_in_editmode = mod_data["show_in_editmode"]
-        if hasattr(mod, "show_on_cage"):
-            mod.show_on_cage = mod_data["show_on_cage"]
-
-        # Move modifier to correct position
-        if "index" in mod_data:
-            target_index = mod_data["index"]
-            current_index = len(obj.modifiers) - 1  # New modifier is added at the end
-
-            # Ensure the object is active and selected before moving the modifier
-            with ViewLayerScope(obj):
-                bpy.context.view_layer.objects.active = obj
-                obj.select_set(True)
-
-                # Move the modifier to the target position
-                # We need to move UP (towards index 0) to reach the target position
-                moves_needed = current_index - target_index
-                for _ in range(moves_needed):
-                    try:
-                        bpy.ops.object.modifier_move_up(modifier=mod.name)
-                    except RuntimeError as e:
-                        log(f"Warning: Could not move modifier to target position: {e}")
-                        break
+    i, mod = found
+    return ArmatureModData(
+        mod.name,
+        mod.object,
+        mod.use_deform_preserve_volume,
+        mod.use_vertex_groups,
+        mod.use_bone_envelopes,
+        mod.vertex_group,
+        mod.invert_vertex_group,
+        mod.show_viewport,
+        mod.show_render,
+        mod.show_in_editmode,
+        getattr(mod, "show_on_cage", False),
+        i,
+    )
+
+
+def _create_armature_modifier(
+    obj: bpy.types.Object, mod_data: Optional[ArmatureModData]
+) -> None:
+    """Create armature modifier with stored settings"""
+    if not mod_data:
+        return
+
+    mod = obj.modifiers.new(mod_data.name, "ARMATURE")
+    mod.object = mod_data.object
+    mod.use_deform_preserve_volume = mod_data.use_deform_preserve_volume
+    mod.use_vertex_groups = mod_data.use_vertex_groups
+    mod.use_bone_envelopes = mod_data.use_bone_envelopes
+    mod.vertex_group = mod_data.vertex_group
+    mod.invert_vertex_group = mod_data.invert_vertex_group
+    mod.show_viewport = mod_data.show_viewport
+    mod.show_render = mod_data.show_render
+    mod.show_in_editmode = mod_data.show_in_editmode
+    if hasattr(mod, "show_on_cage"):
+        mod.show_on_cage = mod_data.show_on_cage
+
+    # Move modifier to correct position
+    target_index = mod_data.index
+    current_index = len(obj.modifiers) - 1  # New modifier is added at the end
+    if target_index >= current_index:
+        return
+
+    # Ensure the object is active and selected before moving the modifier
+    with ViewLayerScope(obj):
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+
+        try:
+            bpy.ops.object.modifier_move_to_index(
+                modifier=mod.name, index=target_index
+            )
+        except RuntimeError as e:
+            log_error("Warning: Could not move modifier to target position: %s", e)
 
 
 # =============================================================================
@@ -539,17 +723,29 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
         """Validate and collect affected mesh objects"""
         affected_meshes = []
         shared_meshes = []
-        warning_meshes = []
 
-        for obj in bpy.data.objects:
+        # Only objects referencing the armature (modifiers, parents, constraints)
+        # can qualify. Every scene is covered because pose.armature_apply()
+        # changes the shared armature data.
+        candidates = bpy.data.user_map(subset=[armature], value_types={"OBJECT"})
+        for obj in sorted(candidates[armature], key=lambda o: o.name_full):
             if obj.type != "MESH":
                 continue
 
-            armature_count = sum(
-                1
-                for mod in obj.modifiers
-                if mod.type == "ARMATURE" and mod.object == armature
-            )
+            # Single pass: count matching armature modifiers and look for
+            # deformation modifiers ahead of the first one
+            armature_count = 0
+            arm_index = -1
+            order_issue = False
+            for i, mod in enumerate(obj.modifiers):
+                mod_type = mod.type
+                if mod_type == "ARMATURE" and mod.object == armature:
+                    armature_count += 1
+                    if arm_index == -1:
+                        arm_index = i
+                        _ARMATURE_MOD_CACHE[obj.name] = (i, mod.name)
+                elif arm_index == -1 and mod_type in _DEFORM_MODS:
+                    order_issue = True
 
             if armature_count > 1:
                 error_msg = bpy.app.translations.pgettext(
@@ -563,9 +759,13 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
                     shared_meshes.append(obj.name)
                     continue
 
-                # Check modifier order
-                if self.has_modifier_order_issue(obj, armature):
-                    warning_meshes.append(obj.name)
+                # Check modifier order; the result is fatal, so stop at the
+                # first offender instead of finishing the scan
+                if order_issue:
+                    warning_msg = bpy.app.translations.pgettext(
+                        "Deformation modifiers before Armature modifier detected: {mesh_list}"
+                    ).format(mesh_list=obj.name)
+                    raise ValueError(warning_msg)
                 affected_meshes.append(obj)
 
         if shared_meshes:
@@ -574,211 +774,211 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
             ).format(mesh_list=", ".join(shared_meshes))
             raise ValueError(error_msg)
 
-        if warning_meshes:
-            warning_msg = bpy.app.translations.pgettext(
-                "Deformation modifiers before Armature modifier detected: {mesh_list}"
-            ).format(mesh_list=", ".join(warning_meshes))
-            raise ValueError(warning_msg)
-
         return affected_meshes
 
-    def has_modifier_order_issue(
-        self, obj: bpy.types.Object, armature: bpy.types.Object
-    ) -> bool:
-        """Check if deformation modifiers come before armature modifier"""
-        arm_index = next(
-            (
-                i
-                for i, mod in enumerate(obj.modifiers)
-                if mod.type == "ARMATURE" and mod.object == armature
-            ),
-            -1,
-        )
-
-        if arm_index == -1:
-            return False
-
-        deformation_mods = {
-            "MESH_DEFORM",
-            "LATTICE",
-            "CLOTH",
-            "SOFT_BODY",
-            "MESH_CACHE",
-            "SURFACE_DEFORM",
-            "VOLUME_DEFORM",
-            "NODES",
-            "DISPLACE",
-            "WAVE",
-            "SHRINKWRAP",
-            "SIMPLE_DEFORM",
-        }
-
-        return any(mod.type in deformation_mods for mod in obj.modifiers[:arm_index])
-
     def _prepare_shape_keys_with_pose(
-        self, obj: bpy.types.Object, armature: bpy.types.Object
-    ) -> PendingMeshChange:
+        self, record: MeshRecord, armature: bpy.types.Object
+    ) -> None:
         """Prepare shape keys with pose applied, without modifying the original object.
 
-        Creates a receiver with all shape keys baked with the current pose.
+        Stores a receiver with all shape keys baked with the current pose on record.
         Raises on failure (caller is responsible for cleaning up pending receivers).
         """
-        shapekey_names = [block.name for block in obj.data.shape_keys.key_blocks]
+        obj = record.obj
+        # Snapshot key blocks once; indexing a list avoids RNA lookups in the loop
+        source_blocks = list(obj.data.shape_keys.key_blocks)
+        shapekey_names = [block.name for block in source_blocks]
         num_shapekeys = len(shapekey_names)
-        log(f"Processing {num_shapekeys} shape keys: {obj.name}")
+        log("Processing %d shape keys: %s", num_shapekeys, obj.name)
 
-        shape_key_props = ShapeKeyManager.store_properties(obj)
+        record.shape_key_props = _store_shapekey_properties(obj)
 
         receiver = copy_object(obj, "shapekey_receiver")
         try:
             apply_shape_key(receiver, 0)  # Keep only base shape key
             apply_armature_modifier_only(receiver, armature)
+            # The deformed base mesh becomes the receiver's basis
+            receiver.shape_key_add(name=shapekey_names[0], from_mix=False)
 
+            # A Basis-only mesh needs no evaluator
             successful_transfers = 0
+            if num_shapekeys > 1:
+                successful_transfers = self._transfer_posed_shape_keys(
+                    obj, armature, receiver, source_blocks, shapekey_names
+                )
 
-            # Process each shape key (skip base shape key at index 0)
-            for shapekey_index in range(1, num_shapekeys):
-                shapekey_name = shapekey_names[shapekey_index]
-                log(f"Processing shape key {shapekey_index}: {shapekey_name}")
-
-                shapekey_obj = None
-                try:
-                    # Create copy for this shape key
-                    shapekey_obj = copy_object(obj, f"shapekey_{shapekey_index}")
-                    apply_shape_key(shapekey_obj, shapekey_index)
-                    apply_armature_modifier_only(shapekey_obj, armature)
+        except Exception:
+            delete_object(receiver)
+            raise
 
-                    validate_vertex_count_compatibility(
-                        receiver, shapekey_obj, shapekey_name
-                    )
-                    # Add to receiver
-                    add_objs_shapekeys(receiver, [shapekey_obj])
-                    validate_shape_key_transfer(
-                        receiver, shapekey_index, shapekey_name
-                    )
+        record.receiver = receiver
+        log("Prepared %s: %d shape keys", obj.name, successful_transfers)
 
-                    # Restore the shape key name
-                    receiver.data.shape_keys.key_blocks[
-                        shapekey_index
-                    ].name = shapekey_name
-                    successful_transfers += 1
+    def _transfer_posed_shape_keys(
+        self,
+        obj: bpy.types.Object,
+        armature: bpy.types.Object,
+        receiver: bpy.types.Object,
+        source_blocks: List[bpy.types.ShapeKey],
+        shapekey_names: List[str],
+    ) -> int:
+        """Add every non-basis shape key of obj to receiver with the pose applied.
 
-                    delete_object(shapekey_obj)
-                    shapekey_obj = None
-                    log(f"Successfully transferred shape key: {shapekey_name}")
+        Returns the number of transferred shape keys. Raises on failure.
+        """
+        successful_transfers = 0
+        # Vertex count cached up front so validation does not re-read RNA
+        receiver_vertex_count = len(receiver.data.vertices)
+
+        # Add every key block before the sweep. shape_key_add tags a relations
+        # rebuild for the whole file, which each depsgraph.update() would pay.
+        for shapekey_name in shapekey_names[1:]:
+            receiver.shape_key_add(name=shapekey_name, from_mix=False)
+        receiver_blocks = list(receiver.data.shape_keys.key_blocks)
+
+        # A single evaluator poses every shape key instead of one copy per key
+        evaluator = create_deform_evaluator(obj, armature)
+        try:
+            with ViewLayerScope(evaluator, armature):
+                # Reuse one depsgraph for the whole sweep; only the evaluator changes
+                depsgraph = bpy.context.evaluated_depsgraph_get()
+                # Each key is written out before the next read, so two buffers suffice
+                coord_buf = np.empty(len(evaluator.data.vertices) * 3, dtype=_F32)
+                deformed_buf = np.empty_like(coord_buf)
+
+                # Process each shape key (skip base shape key at index 0).
+                # One error boundary covers the loop; shapekey_index names the
+                # key that failed.
+                shapekey_index = 0
+                try:
+                    for shapekey_index in range(1, len(shapekey_names)):
+                        shapekey_name = shapekey_names[shapekey_index]
+                        log(
+                            "Processing shape key %d: %s", shapekey_index, shapekey_name
+                        )
+
+                        coords = _get_coords(
+                            source_blocks[shapekey_index].data, coord_buf
+                        )
+                        deformed = read_deformed_coords(
+                            evaluator, coords, depsgraph, deformed_buf
+                        )
+
+                        validate_vertex_count_compatibility(
+                            receiver_vertex_count, deformed.size // 3, shapekey_name
+                        )
+                        # Fill the receiver's key block
+                        _set_coords(receiver_blocks[shapekey_index].data, deformed)
+                        successful_transfers += 1
+                        log("Successfully transferred shape key: %s", shapekey_name)
 
                 except ValueError as ve:
-                    if shapekey_obj:
-                        delete_object(shapekey_obj)
-                    log(f"Validation error for shape key {shapekey_name}: {ve}")
+                    shapekey_name = shapekey_names[shapekey_index]
+                    log_error(
+                        "Validation error for shape key %s: %s", shapekey_name, ve
+                    )
                     error_msg = bpy.app.translations.pgettext(
                         "Shape key '{shapekey_name}': {error}"
                     ).format(shapekey_name=shapekey_name, error=ve)
                     raise ValueError(error_msg)
                 except Exception as e:
-                    if shapekey_obj:
-                        delete_object(shapekey_obj)
-                    log(f"Error processing shape key {shapekey_index}: {e}")
+                    log_error("Error processing shape key %d: %s", shapekey_index, e)
                     raise
+        finally:
+            delete_object(evaluator)
 
-            log(f"Prepared {obj.name}: {successful_transfers} shape keys")
-            return {
-                "obj": obj,
-                "receiver": receiver,
-                "shape_key_props": shape_key_props,
-                "successful_transfers": successful_transfers,
-            }
-
-        except Exception:
-            delete_object(receiver)
-            raise
+        return successful_transfers
 
     def _prepare_no_shapekey_mesh(
-        self, obj: bpy.types.Object, armature: bpy.types.Object
-    ) -> PendingMeshChange:
-        """Prepare a mesh without shape keys by applying the armature on a copy."""
-        log(f"No shape keys on {obj.name}, preparing copy with armature applied")
-        receiver = copy_object(obj, "no_sk_receiver")
-        try:
-            apply_armature_modifier_only(receiver, armature)
-        except Exception:
-            delete_object(receiver)
-            raise
-        return {
-            "obj": obj,
-            "receiver": receiver,
-            "shape_key_props": None,
-            "successful_transfers": 0,
-        }
+        self, record: MeshRecord, armature: bpy.types.Object
+    ) -> None:
+        """Prepare a mesh without shape keys by evaluating its armature deformation.
+
+        No copy is made; the posed positions are written into obj.data on commit.
+        """
+        obj = record.obj
+        log("No shape keys on %s, evaluating armature deformation", obj.name)
+        record.deformed_coords = read_armature_deformed_coords(obj, armature)
 
     def _commit_mesh_changes(
-        self,
-        pending_changes: List[PendingMeshChange],
-        armature: bpy.types.Object,
-    ) -> Tuple[
-        Dict[str, Optional[bpy.types.Key]], List[bpy.types.Mesh]
-    ]:
-        """Apply all pending mesh data swaps.
+        self, records: List[MeshRecord], armature: bpy.types.Object
+    ) -> List[bpy.types.Mesh]:
+        """Apply all pending mesh changes.
 
         Called in the post-destructive zone after pose.armature_apply() succeeds.
-        Returns (original_shape_keys_map, deferred_cleanup).
+        Meshes with shape keys swap in their receiver data; the others are
+        deformed in place. Records the original Key on each record and returns
+        the replaced meshes for deferred cleanup.
         """
-        log("STEP 5: Committing mesh data swaps")
-        original_shape_keys_map: Dict[str, Optional[bpy.types.Key]] = {}
+        log("STEP 5: Committing mesh changes")
         deferred_cleanup: List[bpy.types.Mesh] = []
+        consumed_receivers: List[bpy.types.Object] = []
 
-        for change in pending_changes:
-            obj = change["obj"]
-            receiver = change["receiver"]
-            shape_key_props = change["shape_key_props"]
-
-            orig_data = obj.data
-            original_shape_keys_map[obj.name] = orig_data.shape_keys
-
-            # Remove armature modifiers targeting this armature
-            for mod in list(obj.modifiers):
-                if mod.type == "ARMATURE" and mod.object == armature:
-                    mod_name = mod.name
-                    obj.modifiers.remove(mod)
-                    log(f"Removed existing armature modifier {mod_name}")
+        try:
+            for record in records:
+                obj = record.obj
+                receiver = record.receiver
+
+                orig_data = obj.data
+                record.original_shape_keys = orig_data.shape_keys
+
+                # Remove armature modifiers targeting this armature
+                for mod in list(obj.modifiers):
+                    if mod.type == "ARMATURE" and mod.object == armature:
+                        mod_name = mod.name
+                        obj.modifiers.remove(mod)
+                        log("Removed existing armature modifier %s", mod_name)
+
+                if receiver is None:
+                    # Meshes without shape keys keep their data and are
+                    # deformed in place
+                    _set_coords(orig_data.vertices, record.deformed_coords)
+                    orig_data.update()
+                    record.deformed_coords = None
+                    log("Committed changes for %s: deformed in place", obj.name)
+                    continue
 
-            # Rename originals first so the replacement data can reuse the names.
-            old_mesh_name = orig_data.name
-            old_key_name = orig_data.shape_keys.name if orig_data.shape_keys else None
+                # Rename originals first so the replacement data can reuse the names.
+                old_mesh_name = orig_data.name
+                old_key_name = (
+                    orig_data.shape_keys.name if orig_data.shape_keys else None
+                )
 
-            orig_data.name = old_mesh_name + "_old_temp"
-            if old_key_name is not None and orig_data.shape_keys:
-                orig_data.shape_keys.name = old_key_name + "_old_temp"
+                orig_data.name = old_mesh_name + "_old_temp"
+                if old_key_name is not None and orig_data.shape_keys:
+                    orig_data.shape_keys.name = old_key_name + "_old_temp"
 
-            obj.data = receiver.data
-            obj.data.name = old_mesh_name
-            if old_key_name is not None and obj.data.shape_keys:
-                obj.data.shape_keys.name = old_key_name
+                obj.data = receiver.data
+                obj.data.name = old_mesh_name
+                if old_key_name is not None and obj.data.shape_keys:
+                    obj.data.shape_keys.name = old_key_name
 
-            # Restore shape key properties
-            if shape_key_props:
-                ShapeKeyManager.restore_properties(obj, shape_key_props)
+                # Restore shape key properties
+                if record.shape_key_props:
+                    _restore_shapekey_properties(obj, record.shape_key_props)
 
-            # Keep orig_data alive for driver restoration
-            deferred_cleanup.append(orig_data)
+                # Keep orig_data alive for driver restoration
+                deferred_cleanup.append(orig_data)
+                consumed_receivers.append(receiver)
+                record.receiver = None
 
-            # Remove receiver object (mesh data now owned by obj)
+                log("Committed changes for %s", obj.name)
+        finally:
+            # Remove receiver objects in one batch (mesh data now owned by obj)
             try:
-                bpy.data.objects.remove(receiver)
+                bpy.data.batch_remove(consumed_receivers)
             except Exception as e:
-                log(f"Warning: Could not remove receiver object: {e}")
+                log_error("Warning: Could not remove receiver objects: %s", e)
 
-            log(
-                f"Committed changes for {obj.name}: "
-                f"{change['successful_transfers']} shape keys"
-            )
-
-        return original_shape_keys_map, deferred_cleanup
+        return deferred_cleanup
 
     def _initialize_and_validate(
         self, context: bpy.types.Context
     ) -> Tuple[Optional[OriginalStateDict], Optional[ValidationResult]]:
         """Initialize operation and validate prerequisites"""
+        # Modifier positions from a previous run may be stale
+        _ARMATURE_MOD_CACHE.clear()
+
         # Store original state
         original_state = {
             "mode": context.mode,
@@ -803,52 +1003,52 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
 
     def _collect_and_store_data(
         self, affected_meshes: MeshObjectList, armature: bpy.types.Object
-    ) -> Tuple[ObjectNameToDriverState, ObjectNameToModifierData]:
+    ) -> List[MeshRecord]:
         """Collect and store data for restoration"""
         log("STEP 2: Collecting and storing data for restoration")
-        driver_states = {}
-        saved_armature_modifiers = {}
+        records = []
 
         for obj in affected_meshes:
-            log(f"Storing data for mesh: {obj.name}")
-            driver_states[obj.name] = DriverManager.check_drivers_exist(obj)
-            saved_armature_modifiers[obj.name] = (
-                ModifierManager.store_armature_modifier(obj, armature)
+            log("Storing data for mesh: %s", obj.name)
+            records.append(
+                MeshRecord(
+                    obj=obj,
+                    driver_state=_check_drivers_exist(obj),
+                    armature_mod=_store_armature_modifier(obj, armature),
+                )
             )
 
-        log(f"Found {len(affected_meshes)} meshes to process")
-        return driver_states, saved_armature_modifiers
+        log("Found %d meshes to process", len(affected_meshes))
+        return records
 
     def _prepare_all_meshes(
-        self, affected_meshes: MeshObjectList, armature: bpy.types.Object
-    ) -> Optional[List[PendingMeshChange]]:
+        self, records: List[MeshRecord], armature: bpy.types.Object
+    ) -> bool:
         """Prepare all affected meshes non-destructively.
 
-        Returns a list of PendingMeshChange dicts on success, or None on failure.
-        On failure all receivers are cleaned up automatically.
+        Stores the pending change on each record and returns True on success.
+        On failure all receivers are cleaned up automatically and False is returned.
         """
         log("STEP 3: Preparing shape keys with current pose")
-        pending_changes: List[PendingMeshChange] = []
 
         try:
-            for obj in affected_meshes:
-                log(f"Preparing mesh object: {obj.name}")
+            for record in records:
+                obj = record.obj
+                log("Preparing mesh object: %s", obj.name)
                 if obj.data.shape_keys:
-                    change = self._prepare_shape_keys_with_pose(obj, armature)
+                    self._prepare_shape_keys_with_pose(record, armature)
                 else:
-                    change = self._prepare_no_shapekey_mesh(obj, armature)
-                pending_changes.append(change)
+                    self._prepare_no_shapekey_mesh(record, armature)
         except Exception as e:
             # Clean up all receivers created so far
-            for change in pending_changes:
-                delete_object(change["receiver"])
+            self._cleanup_receivers(records)
             error_msg = bpy.app.translations.pgettext(
                 "Failed to process shape keys for {obj_name}"
             ).format(obj_name=obj.name)
             self.report({"ERROR"}, f"{error_msg}: {e}")
-            return None
+            return False
 
-        return pending_changes
+        return True
 
     def _apply_pose_to_armature(
         self, context: bpy.types.Context, armature: bpy.types.Object
@@ -877,10 +1077,7 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
 
     def _restore_all_data(
         self,
-        processed_meshes: MeshObjectList,
-        saved_armature_modifiers: ObjectNameToModifierData,
-        driver_states: ObjectNameToDriverState,
-        original_shape_keys_map: Dict[str, Optional[bpy.types.Key]],
+        records: List[MeshRecord],
     ) -> List[str]:
         """Restore armature modifiers and drivers for every processed mesh.
 
@@ -889,23 +1086,20 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
         """
         log("STEP 6: Restoring armature modifiers and drivers")
         errors: List[str] = []
-        for obj in processed_meshes:
-            log(f"Restoring modifiers and drivers for: {obj.name}")
+        for record in records:
+            obj = record.obj
+            log("Restoring modifiers and drivers for: %s", obj.name)
 
             try:
-                ModifierManager.create_armature_modifier(
-                    obj, saved_armature_modifiers[obj.name]
-                )
+                _create_armature_modifier(obj, record.armature_mod)
             except Exception as e:
-                log(f"Failed to restore modifier for {obj.name}: {e}")
+                log_error("Failed to restore modifier for %s: %s", obj.name, e)
                 errors.append(f"{obj.name} (modifier): {e}")
 
             try:
-                DriverManager.restore_drivers(
-                    obj, driver_states[obj.name], original_shape_keys_map[obj.name]
-                )
+                _restore_drivers(obj, record.driver_state, record.original_shape_keys)
             except Exception as e:
-                log(f"Failed to restore drivers for {obj.name}: {e}")
+                log_error("Failed to restore drivers for %s: %s", obj.name, e)
                 errors.append(f"{obj.name} (drivers): {e}")
 
         return errors
@@ -915,7 +1109,7 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
         context: bpy.types.Context,
         original_state: OriginalStateDict,
         armature: bpy.types.Object,
-        processed_meshes: MeshObjectList,
+        records: List[MeshRecord],
     ) -> None:
         """Restore original context state and report success."""
         log("STEP 7: Restoring original state")
@@ -933,7 +1127,7 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
 
         success_msg = bpy.app.translations.pgettext(
             "Applied pose as rest for {armature_name} and processed {mesh_count} meshes"
-        ).format(armature_name=armature.name, mesh_count=len(processed_meshes))
+        ).format(armature_name=armature.name, mesh_count=len(records))
         self.report({"INFO"}, success_msg)
 
     def _restore_context(self, original_state: OriginalStateDict) -> None:
@@ -947,19 +1141,14 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
                 if original_state["mode"].startswith("POSE"):
                     bpy.ops.object.mode_set(mode="POSE")
         except Exception as e:
-            log(f"Failed to restore context: {e}")
+            log_error("Failed to restore context: %s", e)
 
     @staticmethod
-    def _cleanup_receivers(
-        pending_changes: Optional[List[PendingMeshChange]],
-    ) -> None:
-        """Delete all receiver objects from pending changes."""
-        if not pending_changes:
-            return
-        for change in pending_changes:
-            receiver = change.get("receiver")
-            if receiver:
-                delete_object(receiver)
+    def _cleanup_receivers(records: List[MeshRecord]) -> None:
+        """Delete all receiver objects that have not been committed."""
+        delete_objects([record.receiver for record in records])
+        for record in records:
+            record.receiver = None
 
     def execute(self, context: bpy.types.Context) -> OperatorResultDict:
         """Main execution method - coordinates the entire operation.
@@ -969,7 +1158,7 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
         """
         original_state = None
         armature = None
-        pending_changes = None
+        records: List[MeshRecord] = []
 
         try:
             # === PRE-DESTRUCTIVE ZONE — CANCELLED is safe ===
@@ -982,41 +1171,36 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
             armature, affected_meshes = validation_result
 
             # Step 2: Collect and store data
-            driver_states, saved_armature_modifiers = self._collect_and_store_data(
-                affected_meshes, armature
-            )
+            records = self._collect_and_store_data(affected_meshes, armature)
 
             # Step 3: Prepare all meshes (non-destructive)
-            pending_changes = self._prepare_all_meshes(affected_meshes, armature)
-            if not pending_changes:
+            if not self._prepare_all_meshes(records, armature):
                 return {"CANCELLED"}
 
         except ValueError as e:
             self.report({"ERROR"}, str(e))
-            self._cleanup_receivers(pending_changes)
+            self._cleanup_receivers(records)
             return {"CANCELLED"}
         except Exception as e:
-            log(f"Error during preparation: {e}")
+            log_error("Error during preparation: %s", e)
             error_msg = bpy.app.translations.pgettext(
                 "Error occurred: {error}"
             ).format(error=e)
             self.report({"ERROR"}, error_msg)
-            self._cleanup_receivers(pending_changes)
+            self._cleanup_receivers(records)
             return {"CANCELLED"}
 
         # === POST-DESTRUCTIVE ZONE — always return FINISHED ===
-        processed_meshes = [c["obj"] for c in pending_changes]
-
         try:
             # Step 4: Apply pose to armature
             self._apply_pose_to_armature(context, armature)
         except Exception as e:
-            log(f"Failed to apply pose to armature: {e}")
+            log_error("Failed to apply pose to armature: %s", e)
             error_msg = bpy.app.translations.pgettext(
                 "Failed to apply pose to armature: {error}"
             ).format(error=e)
             self.report({"ERROR"}, error_msg)
-            self._cleanup_receivers(pending_changes)
+            self._cleanup_receivers(records)
             if original_state:
                 self._restore_context(original_state)
             return {"FINISHED"}
@@ -1024,31 +1208,21 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
         deferred_cleanup: List[bpy.types.Mesh] = []
         try:
             # Step 5: Commit all mesh changes
-            original_shape_keys_map, deferred_cleanup = self._commit_mesh_changes(
-                pending_changes, armature
-            )
-            pending_changes = None  # receivers consumed
+            deferred_cleanup = self._commit_mesh_changes(records, armature)
 
             # Step 6: Restore modifiers and drivers
-            restore_errors = self._restore_all_data(
-                processed_meshes,
-                saved_armature_modifiers,
-                driver_states,
-                original_shape_keys_map,
-            )
+            restore_errors = self._restore_all_data(records)
 
             if restore_errors:
                 error_summary = "; ".join(restore_errors)
-                log(f"Restore errors: {error_summary}")
+                log_error("Restore errors: %s", error_summary)
                 self.report({"WARNING"}, f"Partial restore failures: {error_summary}")
 
             # Step 7: Finalize
-            self._finalize_operation(
-                context, original_state, armature, processed_meshes
-            )
+            self._finalize_operation(context, original_state, armature, records)
 
         except Exception as e:
-            log(f"Error in post-destructive zone: {e}")
+            log_error("Error in post-destructive zone: %s", e)
             error_msg = bpy.app.translations.pgettext(
                 "Error occurred: {error}"
             ).format(error=e)
@@ -1057,11 +1231,11 @@ class POSE_TO_REST_OT_apply(bpy.types.Operator):
                 self._restore_context(original_state)
         finally:
             # Always clean up original mesh data to avoid orphans
-            for mesh_data in deferred_cleanup:
-                try:
-                    bpy.data.meshes.remove(mesh_data)
-                except Exception as e:
-                    log(f"Warning: Could not remove original mesh data: {e}")
+            try:
+                bpy.data.batch_remove(deferred_cleanup)
+            except Exception as e:
+                log_error("Warning: Could not remove original mesh data: %s", e)
+            _ARMATURE_MOD_CACHE.clear()
 
         return {"FINISHED"}
 
@@ -24,9 +24,7 @@ translations_dict = {
         ("*", "Object '{obj_name}' has multiple Armature modifiers"): "オブジェクト'{obj_name}'に複数のアーマチュアモディファイアがあります",
         ("*", "Objects with shared mesh data are not supported. Make them single-user first: {mesh_list}"): "メッシュデータを共有しているオブジェクトはサポートされていません。先にシングルユーザー化してください: {mesh_list}",
         ("*", "Cannot transfer shape key '{shapekey_name}': vertex count mismatch ({base_count} vs {shapekey_count}). Check for modifiers that change vertex count (Decimate, Weld, etc.)."): "シェイプキー'{shapekey_name}'を転送できません: 頂点数が一致しません（{base_count} vs {shapekey_count}）。頂点数を変更するモディファイア（Decimate、Weldなど）を確認してください。",
-        ("*", "Shape key transfer failed for '{shapekey_name}': expected {expected_keys} keys, got {actual_keys}"): "'{shapekey_name}'のシェイプキー転送に失敗しました: {expected_keys}個のキーを期待しましたが、{actual_keys}個でした",
         ("*", "Deformation modifiers before Armature modifier detected: {mesh_list}"): "アーマチュアモディファイアより前にデフォームモディファイアが検出されました: {mesh_list}",
-        ("*", "Cannot transfer shape key '{shapekey_name}': vertex count mismatch after modifiers"): "シェイプキー'{shapekey_name}'を転送できません: モディファイア後の頂点数が一致しません",
         ("*", "Shape key '{shapekey_name}': {error}"): "シェイプキー'{shapekey_name}': {error}",
         
         # Success messages